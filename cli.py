@@ -0,0 +1,178 @@
+"""
+One command line for the Sprint 1 and Sprint 2 scripts.
+
+Subcommands:
+- report: Sprint 1 tables (CSV in outputs/) plus the console summary
+- charts: Sprint 1 PNG charts in outputs/
+- load:   Sprint 2 MongoDB load (same flags as sprint2/load_data.py)
+- query:  latest-year top five and global totals, from Mongo or a local cache
+- profile: run any of the commands above and show where import time goes
+
+Heavy libraries (pandas, matplotlib, pymongo) are only imported inside the
+subcommand that needs them, so `python cli.py query --cache` starts fast.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+BASE_DIR = Path(__file__).parent
+SPRINT2_DIR = BASE_DIR / "sprint2"
+
+
+def use_sprint2() -> None:
+    """Let sprint2 scripts be imported by name, the same way they import each other."""
+    if str(SPRINT2_DIR) not in sys.path:
+        sys.path.insert(0, str(SPRINT2_DIR))
+
+
+def cmd_report(args: argparse.Namespace) -> None:
+    import main as sprint1
+
+    tables = sprint1.build_tables()
+    sprint1.save_tables(*tables)
+    sprint1.print_summary(*tables)
+
+
+def cmd_charts(args: argparse.Namespace) -> None:
+    import main as sprint1
+
+    sprint1.save_charts(*sprint1.build_tables())
+    print(f"Charts saved to {sprint1.output_path}")
+
+
+def cmd_load(args: argparse.Namespace) -> None:
+    use_sprint2()
+    import load_data
+
+    load_data.check_arguments(args.parser, args)
+    load_data.run(args)
+
+
+def cmd_query(args: argparse.Namespace) -> None:
+    use_sprint2()
+    import query_examples
+
+    if args.cache:
+        summary = query_examples.summarize_rows(query_examples.read_cache(args.cache))
+    else:
+        summary = query_examples.summarize_mongo(args.env_file)
+    query_examples.print_summary(*summary)
+
+
+def parse_importtime(stderr: str) -> List[tuple]:
+    """Turn `-X importtime` output into [(cumulative_us, self_us, module), ...]."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        self_us, cumulative_us, module = parts
+        rows.append((int(cumulative_us), int(self_us), module.rstrip()))
+    return rows
+
+
+def total_import_us(rows: List[tuple]) -> int:
+    # top-level imports have no leading indentation, so their cumulative times add up to the total
+    return sum(cumulative for cumulative, _, module in rows if not module.startswith("  "))
+
+
+def cmd_profile(args: argparse.Namespace) -> None:
+    import subprocess
+
+    command = [arg for arg in args.command if arg != "--"]
+    if not command:
+        command = ["--help"]
+    # only stderr is captured (that is where -X importtime writes); the command's own output still shows
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(Path(__file__).resolve()), *command],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    rows = parse_importtime(result.stderr)
+    total_us = total_import_us(rows)
+    # pass warnings and tracebacks through untouched
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            print(line, file=sys.stderr)
+
+    print(f"\nImport profile for: cli.py {' '.join(command)}")
+    print(f"Modules imported: {len(rows)}")
+    print(f"Total import time: {total_us / 1000:.1f} ms")
+    print(f"\nSlowest {args.top} by cumulative time (ms):")
+    for cumulative, self_us, module in sorted(rows, reverse=True)[: args.top]:
+        print(f"{cumulative / 1000:9.1f} {self_us / 1000:9.1f}  {module.strip()}")
+    if result.returncode != 0:
+        print(f"\nCommand exited with {result.returncode} (see its output above).")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    use_sprint2()
+    # both modules import pandas/pymongo lazily, so they are safe to import up front
+    import load_data
+    from query_examples import DEFAULT_CACHE_PATH
+
+    parser = argparse.ArgumentParser(description="Tourism receipts pipeline (Sprint 1 + Sprint 2).")
+    subparsers = parser.add_subparsers(dest="subcommand", required=True)
+
+    report = subparsers.add_parser("report", help="Save Sprint 1 tables and print the summary.")
+    report.set_defaults(func=cmd_report)
+
+    charts = subparsers.add_parser("charts", help="Save Sprint 1 charts to outputs/.")
+    charts.set_defaults(func=cmd_charts)
+
+    load = subparsers.add_parser("load", help="Load receipts into MongoDB (see sprint2/README.md).")
+    # .env lives next to the sprint2 scripts (see sprint2/README.md), not at the repo root
+    load_data.add_arguments(load, env_file=str(SPRINT2_DIR / ".env"))
+    load.set_defaults(func=cmd_load, parser=load)
+
+    query = subparsers.add_parser("query", help="Print the latest-year top five and global totals.")
+    query.add_argument(
+        "--env-file",
+        default=SPRINT2_DIR / ".env",
+        type=Path,
+        help="Path to .env file with MONGODB_URI and DB_NAME (default: sprint2/.env)",
+    )
+    query.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_PATH,
+        type=Path,
+        metavar="PATH",
+        help="Answer from the JSON cache written by `load --write-cache` instead of MongoDB.",
+    )
+    query.set_defaults(func=cmd_query)
+
+    profile = subparsers.add_parser(
+        "profile",
+        help="Run another subcommand (with all its side effects) and show its import time.",
+        description=(
+            "Runs the given subcommand for real under `python -X importtime`, so `profile load` "
+            "writes to MongoDB and `profile report`/`profile charts` overwrite outputs/. "
+            "`profile query --cache` only reads; `profile load --skip-mongo` only rewrites the local cache."
+        ),
+    )
+    profile.add_argument("--top", type=int, default=15, help="How many modules to list (default: 15).")
+    profile.add_argument(
+        "command",
+        nargs=argparse.REMAINDER,
+        help="Subcommand and flags to profile, e.g. `profile query --cache`.",
+    )
+    profile.set_defaults(func=cmd_profile)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
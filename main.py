@@ -1,7 +1,6 @@
 # important libraries 
 from pathlib import Path
 import pandas as pd
-import matplotlib.pyplot as plt
 
 #setting up our paths
 data_path = Path(__file__).parent / "data" / "travel_items.csv"
@@ -9,7 +8,8 @@ metadata_path = Path(__file__).parent / "data" / "metadata_country.csv"
 output_path = Path(__file__).parent/'outputs'
 
 
-def main():
+def build_tables():
+    """Run steps 1-6 and return (last_year, top_countries, global_totals)."""
 
 ##### Step 1 - Loading the data and metadata
     raw_df = pd.read_csv(data_path, skiprows=4)
@@ -94,8 +94,14 @@ def main():
     #keep only the columns we care about and sort from oldest to newest year
     global_totals = global_totals[['Year', 'Receipts_USD_Billions']].sort_values('Year')
 
+    return last_year, top_countries, global_totals
+
 
+def save_charts(last_year, top_countries, global_totals):
 ##### Step 6.5 - Quick charts for the outputs
+    #matplotlib is slow to import, so we only load it when we draw charts
+    import matplotlib.pyplot as plt
+
     output_path.mkdir(exist_ok=True)
 
     fig, ax = plt.subplots()
@@ -116,12 +122,17 @@ def main():
     fig.savefig(output_path / 'global_receipts_recent_years.png', dpi=150)
     plt.close(fig)
 
+
+def save_tables(last_year, top_countries, global_totals):
 ##### Step 7 - wrap up 
     ##saving our tables into CSV files
+    output_path.mkdir(exist_ok=True)
     top_countries.to_csv(output_path / f'top_countries_{last_year}.csv', index=False)
     global_totals.to_csv(output_path / 'global_receipts_recent_years.csv', index=False)
     print('Tables saved to output folder')
-    
+
+
+def print_summary(last_year, top_countries, global_totals):
     ##we can now view the top 5 earners on the last available year
     print("\nTop tourism earners (USD billions):")
     print(top_countries[['Country', 'Code', f'{last_year}_Receipts_USD_Billions']].to_string(index=False))
@@ -129,5 +140,12 @@ def main():
     print("\nGlobal tourism receipts (USD billions):")
     print(global_totals.to_string(index=False))
 
+
+def main():
+    last_year, top_countries, global_totals = build_tables()
+    save_charts(last_year, top_countries, global_totals)
+    save_tables(last_year, top_countries, global_totals)
+    print_summary(last_year, top_countries, global_totals)
+
 if __name__ == "__main__":
     main()
@@ -8,6 +8,9 @@ Default locations assume:
 It creates/updates two collections:
 - countries: one document per real country with region/income metadata
 - receipts: one document per country-year with USD totals (and billions helper)
+
+With --write-cache it also saves the receipts rows as local JSON so
+query_examples.py can answer without MongoDB.
 """
 
 from __future__ import annotations
@@ -15,16 +18,22 @@ from __future__ import annotations
 import argparse
 import os
 from pathlib import Path
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
+
+from query_examples import DEFAULT_CACHE_PATH, write_cache
 
-import pandas as pd
-from dotenv import load_dotenv
-from pymongo import MongoClient, UpdateOne
-from pymongo.collection import Collection
+# pandas, dotenv and pymongo are imported where they are used, so cli.py can
+# register the load flags without paying for them
+if TYPE_CHECKING:
+    import pandas as pd
+    from pymongo import MongoClient
+    from pymongo.collection import Collection
 
 
 def load_sources(base_dir: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Load the raw World Bank CSV and the country metadata CSV."""
+    import pandas as pd
+
     # sprint2 now lives inside sprint1/, so data is one level up in ../data
     sprint1_data = base_dir.parent / "data"
     travel_path = sprint1_data / "travel_items.csv"
@@ -43,6 +52,8 @@ def load_sources(base_dir: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
 
 def clean_data(raw_df: pd.DataFrame, meta_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Return (countries_df, receipts_df) ready for Mongo inserts."""
+    import pandas as pd
+
     meta_cols = ["Country Code", "Region", "IncomeGroup", "TableName"]
     meta_df = meta_df[meta_cols]
 
@@ -90,6 +101,8 @@ def clean_data(raw_df: pd.DataFrame, meta_df: pd.DataFrame) -> Tuple[pd.DataFram
 
 
 def upsert_countries(collection: Collection, countries_df: pd.DataFrame) -> int:
+    from pymongo import UpdateOne
+
     requests = []
     for country in countries_df.to_dict(orient="records"):
         requests.append(
@@ -106,6 +119,8 @@ def upsert_countries(collection: Collection, countries_df: pd.DataFrame) -> int:
 
 
 def upsert_receipts(collection: Collection, receipts_df: pd.DataFrame, batch_size: int = 2000) -> int:
+    from pymongo import UpdateOne
+
     total_written = 0
     for start in range(0, len(receipts_df), batch_size):
         chunk = receipts_df.iloc[start : start + batch_size]
@@ -133,12 +148,11 @@ def get_collections(client: MongoClient):
     return db[countries_name], db[receipts_name]
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Load tourism receipts into MongoDB.")
+def add_arguments(parser: argparse.ArgumentParser, env_file: str = ".env") -> None:
     parser.add_argument(
         "--env-file",
-        default=".env",
-        help="Path to .env file with MONGODB_URI and DB_NAME (default: .env)",
+        default=env_file,
+        help=f"Path to .env file with MONGODB_URI and DB_NAME (default: {env_file})",
     )
     parser.add_argument(
         "--reset-collections",
@@ -148,23 +162,63 @@ def main():
     parser.add_argument(
         "--limit",
         type=int,
-        help="Optional cap on number of receipts rows to load (for quick tests).",
+        help="Optional cap on number of receipts rows to load into Mongo (for quick tests; the cache stays complete).",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--write-cache",
+        nargs="?",
+        const=DEFAULT_CACHE_PATH,
+        type=Path,
+        metavar="PATH",
+        help=f"Also save receipts rows as JSON for offline queries (default: {DEFAULT_CACHE_PATH.name}).",
+    )
+    parser.add_argument(
+        "--skip-mongo",
+        action="store_true",
+        help="Only build the local cache; do not connect to MongoDB (implies --write-cache).",
+    )
+
+
+def check_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject Mongo-only flags when --skip-mongo means they would be ignored."""
+    if args.skip_mongo:
+        ignored = [
+            flag
+            for flag, value in (("--reset-collections", args.reset_collections), ("--limit", args.limit))
+            if value
+        ]
+        if ignored:
+            parser.error(f"{' and '.join(ignored)} cannot be combined with --skip-mongo (Mongo load only).")
+
+
+def run(args: argparse.Namespace) -> None:
+    from dotenv import load_dotenv
+
+    if args.skip_mongo and not args.write_cache:
+        args.write_cache = DEFAULT_CACHE_PATH
 
     load_dotenv(args.env_file)
 
     mongo_uri = os.getenv("MONGODB_URI")
-    if not mongo_uri:
+    if not mongo_uri and not args.skip_mongo:
         raise ValueError("Set MONGODB_URI in .env or environment.")
 
     base_dir = Path(__file__).parent
     raw_df, meta_df = load_sources(base_dir)
     countries_df, receipts_df = clean_data(raw_df, meta_df)
 
+    # the cache always gets every row so offline totals match a full load
+    if args.write_cache:
+        cached = write_cache(args.write_cache, receipts_df.to_dict(orient="records"))
+        print(f"Cached {cached} receipts rows to {args.write_cache}")
+    if args.skip_mongo:
+        return
+
     if args.limit:
         receipts_df = receipts_df.iloc[: args.limit]
 
+    from pymongo import MongoClient
+
     client = MongoClient(mongo_uri)
     countries_col, receipts_col = get_collections(client)
 
@@ -197,5 +251,13 @@ def main():
             print(f"- {doc['country']} ({doc['code']}): {billions} USD billions")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Load tourism receipts into MongoDB.")
+    add_arguments(parser)
+    args = parser.parse_args()
+    check_arguments(parser, args)
+    run(args)
+
+
 if __name__ == "__main__":
     main()
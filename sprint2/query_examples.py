@@ -4,16 +4,61 @@ Simple query runner for Sprint 2.
 Prints:
 - Latest-year top 5 earners
 - Global totals (USD billions) by year
+
+Answers come from MongoDB by default, or from a local JSON cache written by
+`load_data.py --write-cache` (no pandas or pymongo needed for that path).
 """
 
+from __future__ import annotations
+
+import json
 import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
 
-from dotenv import load_dotenv
-from pymongo import MongoClient
+DEFAULT_CACHE_PATH = Path(__file__).parent / "receipts_cache.json"
 
 
-def main():
-    load_dotenv(".env")
+def write_cache(path: Path, rows: Iterable[dict]) -> int:
+    """Save receipts rows (one dict per country-year) as a JSON cache."""
+    rows = list(rows)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(rows, f)
+    return len(rows)
+
+
+def read_cache(path: Path) -> List[dict]:
+    if not path.exists():
+        raise SystemExit(f"No cache at {path}. Build it first with load_data.py --write-cache.")
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def summarize_rows(rows: List[dict]) -> Tuple[int, List[dict], List[Tuple[int, float]]]:
+    """Return (latest_year, top5 rows, [(year, total_billions), ...]) from cached rows."""
+    if not rows:
+        raise SystemExit("No receipts found in cache. Rebuild it with load_data.py --write-cache.")
+    latest_year = max(row["year"] for row in rows)
+    top5 = sorted(
+        (row for row in rows if row["year"] == latest_year),
+        key=lambda row: row["receipts_usd"],
+        reverse=True,
+    )[:5]
+
+    totals: Dict[int, float] = {}
+    for row in rows:
+        totals[row["year"]] = totals.get(row["year"], 0.0) + row["receipts_usd"]
+    by_year = [(year, round(total / 1e9, 2)) for year, total in sorted(totals.items())]
+    return latest_year, top5, by_year
+
+
+def summarize_mongo(env_file: str = ".env") -> Tuple[int, List[dict], List[Tuple[int, float]]]:
+    """Return the same summary as summarize_rows, straight from MongoDB."""
+    from dotenv import load_dotenv
+    from pymongo import MongoClient
+
+    load_dotenv(env_file)
     mongo_uri = os.environ["MONGODB_URI"]
     db_name = os.getenv("DB_NAME", "tourism")
     receipts_name = os.getenv("RECEIPTS_COLLECTION", "receipts")
@@ -26,19 +71,29 @@ def main():
         raise SystemExit("No receipts found. Load data first with load_data.py.")
     latest_year = latest["year"]
 
-    print(f"Top 5 for {latest_year}:")
-    top5 = receipts.find({"year": latest_year}).sort("receipts_usd", -1).limit(5)
-    for doc in top5:
-        print(f"- {doc['country']} ({doc['code']}): {doc['receipts_usd_billions']} USD billions")
+    top5 = list(receipts.find({"year": latest_year}).sort("receipts_usd", -1).limit(5))
 
-    print("\nGlobal totals (billions) by year:")
     pipeline = [
         {"$group": {"_id": "$year", "total_usd": {"$sum": "$receipts_usd"}}},
         {"$addFields": {"total_billions": {"$round": [{"$divide": ["$total_usd", 1e9]}, 2]}}},
         {"$sort": {"_id": 1}},
     ]
-    for row in receipts.aggregate(pipeline):
-        print(f"{row['_id']}: {row['total_billions']}")
+    by_year = [(row["_id"], row["total_billions"]) for row in receipts.aggregate(pipeline)]
+    return latest_year, top5, by_year
+
+
+def print_summary(latest_year: int, top5: List[dict], by_year: List[Tuple[int, float]]) -> None:
+    print(f"Top 5 for {latest_year}:")
+    for doc in top5:
+        print(f"- {doc['country']} ({doc['code']}): {doc['receipts_usd_billions']} USD billions")
+
+    print("\nGlobal totals (billions) by year:")
+    for year, total_billions in by_year:
+        print(f"{year}: {total_billions}")
+
+
+def main():
+    print_summary(*summarize_mongo(".env"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+
+import cli  # noqa: E402
+
+cli.use_sprint2()
+import load_data  # noqa: E402
+from query_examples import read_cache, summarize_rows, write_cache  # noqa: E402
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        80 |        200 | io
+import time:       300 |        300 |     _json
+import time:       500 |        800 |   json.decoder
+import time:       400 |       1200 | json
+unrelated stderr line
+"""
+
+
+def row(code, year, usd):
+    return {
+        "code": code,
+        "country": code.title(),
+        "region": "Somewhere",
+        "year": year,
+        "receipts_usd": usd,
+        "receipts_usd_billions": round(usd / 1e9, 2),
+    }
+
+
+def test_parse_importtime_skips_header_and_other_lines():
+    rows = cli.parse_importtime(IMPORTTIME_SAMPLE)
+
+    assert len(rows) == 5
+    assert rows[0] == (120, 120, "   _io")
+    assert rows[-1] == (1200, 400, " json")
+
+
+def test_parse_importtime_top_level_cumulative_adds_to_total():
+    rows = cli.parse_importtime(IMPORTTIME_SAMPLE)
+
+    assert cli.total_import_us(rows) == 200 + 1200
+
+
+def test_summarize_rows_uses_latest_year_for_top_five():
+    rows = [row(f"C{i}", 2020, (i + 1) * 1e9) for i in range(7)]
+    rows.append(row("OLD", 2019, 99e9))
+
+    latest_year, top5, _ = summarize_rows(rows)
+
+    assert latest_year == 2020
+    assert [doc["code"] for doc in top5] == ["C6", "C5", "C4", "C3", "C2"]
+
+
+def test_summarize_rows_rounds_totals_per_year():
+    rows = [
+        row("AAA", 2019, 1_234_000_000),
+        row("BBB", 2019, 1_000_000),
+        row("AAA", 2020, 500_000_000),
+    ]
+
+    _, _, by_year = summarize_rows(rows)
+
+    assert by_year == [(2019, 1.24), (2020, 0.5)]
+
+
+def test_cache_round_trip(tmp_path):
+    rows = [row("AAA", 2020, 2e9), row("BBB", 2019, 1e9)]
+    path = tmp_path / "nested" / "cache.json"
+
+    assert write_cache(path, rows) == 2
+    assert read_cache(path) == rows
+
+
+def test_read_cache_missing_file_exits(tmp_path):
+    with pytest.raises(SystemExit, match="No cache at"):
+        read_cache(tmp_path / "missing.json")
+
+
+def test_query_cache_skips_heavy_imports(tmp_path):
+    path = tmp_path / "cache.json"
+    write_cache(path, [row("AAA", 2020, 3e9), row("BBB", 2020, 1e9), row("AAA", 2019, 2.5e9)])
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(BASE_DIR)!r})\n"
+        "import cli\n"
+        f"cli.main(['query', '--cache', {str(path)!r}])\n"
+        "heavy = [m for m in ('pandas', 'pymongo', 'matplotlib', 'dotenv') if m in sys.modules]\n"
+        "print('heavy:', heavy)\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.splitlines() == [
+        "Top 5 for 2020:",
+        "- Aaa (AAA): 3.0 USD billions",
+        "- Bbb (BBB): 1.0 USD billions",
+        "",
+        "Global totals (billions) by year:",
+        "2019: 2.5",
+        "2020: 4.0",
+        "heavy: []",
+    ]
+
+
+def test_load_flags_parse_without_pandas():
+    args = cli.build_parser().parse_args(["load", "--skip-mongo"])
+
+    assert args.func is cli.cmd_load
+    assert args.skip_mongo
+    assert args.env_file == str(cli.SPRINT2_DIR / ".env")
+
+
+@pytest.mark.parametrize("extra", [["--limit", "5"], ["--reset-collections"]])
+def test_skip_mongo_rejects_mongo_only_flags(extra, capsys):
+    parser = cli.build_parser()
+    args = parser.parse_args(["load", "--skip-mongo", *extra])
+
+    with pytest.raises(SystemExit) as excinfo:
+        load_data.check_arguments(args.parser, args)
+
+    assert excinfo.value.code == 2
+    assert "cannot be combined with --skip-mongo" in capsys.readouterr().err